@@ -4,11 +4,32 @@ import json
 import os
 import re
 import shutil
+import time
 from pathlib import Path
 
+from nanobot.utils.helpers import read_text_cached
+
 # Default builtin skills directory (relative to this file)
 BUILTIN_SKILLS_DIR = Path(__file__).parent.parent / "skills"
 
+# How long a PATH lookup for a skill's required binary stays valid
+_WHICH_TTL_S = 5.0
+_which_cache: dict[str, tuple[float, bool]] = {}
+
+_FRONTMATTER_RE = re.compile(r"^---\n(.*?)\n---", re.DOTALL)
+_FRONTMATTER_BLOCK_RE = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
+
+
+def _has_bin(name: str) -> bool:
+    """shutil.which() with a short TTL; requirements are checked per skill on every prompt."""
+    now = time.monotonic()
+    hit = _which_cache.get(name)
+    if hit and now - hit[0] < _WHICH_TTL_S:
+        return hit[1]
+    found = shutil.which(name) is not None
+    _which_cache[name] = (now, found)
+    return found
+
 
 class SkillsLoader:
     """
@@ -22,6 +43,10 @@ class SkillsLoader:
         self.workspace = workspace
         self.workspace_skills = workspace / "skills"
         self.builtin_skills = builtin_skills_dir or BUILTIN_SKILLS_DIR
+        # Builtin skills ship with the package and don't appear at runtime; check once.
+        self._builtin_skills_exist = self.builtin_skills.is_dir()
+        # SKILL.md files are read several times per prompt build; reuse until they change.
+        self._content_cache: dict[Path, tuple[tuple[int, int], str]] = {}
 
     def list_skills(self, filter_unavailable: bool = True) -> list[dict[str, str]]:
         """
@@ -36,26 +61,40 @@ class SkillsLoader:
         skills = []
 
         # Workspace skills (highest priority)
-        if self.workspace_skills.exists():
-            for skill_dir in self.workspace_skills.iterdir():
-                if skill_dir.is_dir():
-                    skill_file = skill_dir / "SKILL.md"
-                    if skill_file.exists():
-                        skills.append({"name": skill_dir.name, "path": str(skill_file), "source": "workspace"})
+        for name, skill_file in self._scan_skill_dirs(self.workspace_skills):
+            skills.append({"name": name, "path": skill_file, "source": "workspace"})
 
         # Built-in skills
-        if self.builtin_skills and self.builtin_skills.exists():
-            for skill_dir in self.builtin_skills.iterdir():
-                if skill_dir.is_dir():
-                    skill_file = skill_dir / "SKILL.md"
-                    if skill_file.exists() and not any(s["name"] == skill_dir.name for s in skills):
-                        skills.append({"name": skill_dir.name, "path": str(skill_file), "source": "builtin"})
+        if self._builtin_skills_exist:
+            seen = {s["name"] for s in skills}
+            for name, skill_file in self._scan_skill_dirs(self.builtin_skills):
+                if name not in seen:
+                    skills.append({"name": name, "path": skill_file, "source": "builtin"})
 
         # Filter by requirements
         if filter_unavailable:
             return [s for s in skills if self._check_requirements(self._get_skill_meta(s["name"]))]
         return skills
 
+    @staticmethod
+    def _scan_skill_dirs(root: Path) -> list[tuple[str, str]]:
+        """Return (name, SKILL.md path) for each skill directory under root.
+
+        Uses os.scandir so the is-directory check comes from the directory listing
+        instead of a separate stat per entry.
+        """
+        found = []
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        skill_file = os.path.join(entry.path, "SKILL.md")
+                        if os.path.isfile(skill_file):
+                            found.append((entry.name, skill_file))
+        except OSError:
+            return []
+        return found
+
     def load_skill(self, name: str) -> str | None:
         """
         Load a skill by name.
@@ -67,15 +106,13 @@ class SkillsLoader:
             Skill content or None if not found.
         """
         # Check workspace first
-        workspace_skill = self.workspace_skills / name / "SKILL.md"
-        if workspace_skill.exists():
-            return workspace_skill.read_text(encoding="utf-8")
+        content = read_text_cached(self.workspace_skills / name / "SKILL.md", self._content_cache)
+        if content is not None:
+            return content
 
         # Check built-in
-        if self.builtin_skills:
-            builtin_skill = self.builtin_skills / name / "SKILL.md"
-            if builtin_skill.exists():
-                return builtin_skill.read_text(encoding="utf-8")
+        if self._builtin_skills_exist:
+            return read_text_cached(self.builtin_skills / name / "SKILL.md", self._content_cache)
 
         return None
 
@@ -144,7 +181,7 @@ class SkillsLoader:
         missing = []
         requires = skill_meta.get("requires", {})
         for b in requires.get("bins", []):
-            if not shutil.which(b):
+            if not _has_bin(b):
                 missing.append(f"CLI: {b}")
         for env in requires.get("env", []):
             if not os.environ.get(env):
@@ -161,7 +198,7 @@ class SkillsLoader:
     def _strip_frontmatter(self, content: str) -> str:
         """Remove YAML frontmatter from markdown content."""
         if content.startswith("---"):
-            match = re.match(r"^---\n.*?\n---\n", content, re.DOTALL)
+            match = _FRONTMATTER_BLOCK_RE.match(content)
             if match:
                 return content[match.end():].strip()
         return content
@@ -178,7 +215,7 @@ class SkillsLoader:
         """Check if skill requirements are met (bins, env vars)."""
         requires = skill_meta.get("requires", {})
         for b in requires.get("bins", []):
-            if not shutil.which(b):
+            if not _has_bin(b):
                 return False
         for env in requires.get("env", []):
             if not os.environ.get(env):
@@ -215,7 +252,7 @@ class SkillsLoader:
             return None
 
         if content.startswith("---"):
-            match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
+            match = _FRONTMATTER_RE.match(content)
             if match:
                 # Simple YAML parsing
                 metadata = {}
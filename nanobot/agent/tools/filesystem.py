@@ -1,5 +1,6 @@
 """File system tools: read, write, edit."""
 
+import asyncio
 import difflib
 from pathlib import Path
 from typing import Any
@@ -54,8 +55,7 @@ class ReadFileTool(Tool):
             if not file_path.is_file():
                 return f"Error: Not a file: {path}"
 
-            content = file_path.read_text(encoding="utf-8")
-            return content
+            return await asyncio.to_thread(file_path.read_text, encoding="utf-8")
         except PermissionError as e:
             return f"Error: {e}"
         except Exception as e:
@@ -92,7 +92,7 @@ class WriteFileTool(Tool):
         try:
             file_path = _resolve_path(path, self._workspace, self._allowed_dir)
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content, encoding="utf-8")
+            await asyncio.to_thread(file_path.write_text, content, encoding="utf-8")
             return f"Successfully wrote {len(content)} bytes to {file_path}"
         except PermissionError as e:
             return f"Error: {e}"
@@ -133,7 +133,7 @@ class EditFileTool(Tool):
             if not file_path.exists():
                 return f"Error: File not found: {path}"
 
-            content = file_path.read_text(encoding="utf-8")
+            content = await asyncio.to_thread(file_path.read_text, encoding="utf-8")
 
             if old_text not in content:
                 return self._not_found_message(old_text, content, path)
@@ -144,7 +144,7 @@ class EditFileTool(Tool):
                 return f"Warning: old_text appears {count} times. Please provide more context to make it unique."
 
             new_content = content.replace(old_text, new_text, 1)
-            file_path.write_text(new_content, encoding="utf-8")
+            await asyncio.to_thread(file_path.write_text, new_content, encoding="utf-8")
 
             return f"Successfully edited {file_path}"
         except PermissionError as e:
@@ -8,6 +8,9 @@ from typing import Any
 
 from nanobot.agent.tools.base import Tool
 
+_WIN_PATH_RE = re.compile(r"[A-Za-z]:\\[^\s\"'|><;]+")        # Windows: C:\...
+_POSIX_PATH_RE = re.compile(r"(?:^|[\s|>])(/[^\s\"'>]+)")    # POSIX: /absolute only
+
 
 class ExecTool(Tool):
     """Tool to execute shell commands."""
@@ -153,6 +156,6 @@ class ExecTool(Tool):
 
     @staticmethod
     def _extract_absolute_paths(command: str) -> list[str]:
-        win_paths = re.findall(r"[A-Za-z]:\\[^\s\"'|><;]+", command)   # Windows: C:\...
-        posix_paths = re.findall(r"(?:^|[\s|>])(/[^\s\"'>]+)", command) # POSIX: /absolute only
+        win_paths = _WIN_PATH_RE.findall(command)
+        posix_paths = _POSIX_PATH_RE.findall(command)
         return win_paths + posix_paths
@@ -156,6 +156,14 @@ class ChannelManager:
         except Exception as e:
             logger.error("Failed to start channel {}: {}", name, e)
 
+    async def _stop_channel(self, name: str, channel: BaseChannel) -> None:
+        """Stop a channel and log any exceptions."""
+        try:
+            await channel.stop()
+            logger.info("Stopped {} channel", name)
+        except Exception as e:
+            logger.error("Error stopping {}: {}", name, e)
+
     async def start_all(self) -> None:
         """Start all channels and the outbound dispatcher."""
         if not self.channels:
@@ -186,13 +194,10 @@ class ChannelManager:
             except asyncio.CancelledError:
                 pass
 
-        # Stop all channels
-        for name, channel in self.channels.items():
-            try:
-                await channel.stop()
-                logger.info("Stopped {} channel", name)
-            except Exception as e:
-                logger.error("Error stopping {}: {}", name, e)
+        # Stop all channels concurrently so one slow disconnect doesn't delay the rest
+        await asyncio.gather(
+            *(self._stop_channel(name, channel) for name, channel in self.channels.items())
+        )
 
     async def _dispatch_outbound(self) -> None:
         """Dispatch outbound messages to the appropriate channel."""
@@ -241,12 +241,28 @@ def _make_provider(config: Config):
 # ============================================================================
 
 
+def _run_event_loop(main) -> None:
+    """Run a coroutine to completion, on uvloop when it is installed (non-Windows)."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(main)
+            return
+    asyncio.run(main)
+
+
 @app.command()
 def gateway(
     port: int = typer.Option(18790, "--port", "-p", help="Gateway port"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ):
     """Start the nanobot gateway."""
+    from loguru import logger
+
     from nanobot.agent.loop import AgentLoop
     from nanobot.bus.queue import MessageBus
     from nanobot.channels.manager import ChannelManager
@@ -400,13 +416,20 @@ def gateway(
         except KeyboardInterrupt:
             console.print("\nShutting down...")
         finally:
-            await agent.close_mcp()
             heartbeat.stop()
             cron.stop()
             agent.stop()
-            await channels.stop_all()
+            # Independent teardown: don't make channel disconnects wait on MCP servers
+            results = await asyncio.gather(
+                agent.close_mcp(),
+                channels.stop_all(),
+                return_exceptions=True,
+            )
+            for step, result in zip(("MCP shutdown", "Channel shutdown"), results):
+                if isinstance(result, BaseException):
+                    logger.opt(exception=result).error("{} failed: {}", step, result)
 
-    asyncio.run(run())
+    _run_event_loop(run())
 
 
 
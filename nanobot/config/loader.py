@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 
 from nanobot.config.schema import Config
+from nanobot.utils.helpers import atomic_write_text
 
 
 def get_config_path() -> Path:
@@ -54,9 +55,7 @@ def save_config(config: Config, config_path: Path | None = None) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
     data = config.model_dump(by_alias=True)
-
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    atomic_write_text(path, json.dumps(data, indent=2, ensure_ascii=False), durable=True)
 
 
 def _migrate_config(data: dict) -> dict:
@@ -11,6 +11,7 @@ from typing import Any, Callable, Coroutine
 from loguru import logger
 
 from nanobot.cron.types import CronJob, CronJobState, CronPayload, CronSchedule, CronStore
+from nanobot.utils.helpers import atomic_write_text
 
 
 def _now_ms() -> int:
@@ -169,15 +170,16 @@ class CronService:
             ]
         }
 
-        self.store_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        atomic_write_text(self.store_path, json.dumps(data, indent=2, ensure_ascii=False))
         self._last_mtime = self.store_path.stat().st_mtime
     
     async def start(self) -> None:
         """Start the cron service."""
         self._running = True
-        self._load_store()
+        # Keep jobs.json disk I/O off the event loop while other services start up
+        await asyncio.to_thread(self._load_store)
         self._recompute_next_runs()
-        self._save_store()
+        await asyncio.to_thread(self._save_store)
         self._arm_timer()
         logger.info("Cron service started with {} jobs", len(self._store.jobs if self._store else []))
 
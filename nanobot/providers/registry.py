@@ -13,6 +13,7 @@ Every entry writes out all fields so you can copy-paste as a template.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 
@@ -403,6 +404,13 @@ PROVIDERS: tuple[ProviderSpec, ...] = (
 # Lookup helpers
 # ---------------------------------------------------------------------------
 
+# PROVIDERS is immutable, so derive the lookup tables once at import.
+_BY_NAME: dict[str, ProviderSpec] = {s.name: s for s in PROVIDERS}
+_STD_SPECS: tuple[ProviderSpec, ...] = tuple(s for s in PROVIDERS if not s.is_gateway and not s.is_local)
+_STD_NAMES: frozenset[str] = frozenset(s.name for s in _STD_SPECS)
+
+
+@lru_cache(maxsize=128)
 def find_by_model(model: str) -> ProviderSpec | None:
     """Match a standard provider by model-name keyword (case-insensitive).
     Skips gateways/local — those are matched by api_key/api_base instead."""
@@ -410,14 +418,12 @@ def find_by_model(model: str) -> ProviderSpec | None:
     model_normalized = model_lower.replace("-", "_")
     model_prefix = model_lower.split("/", 1)[0] if "/" in model_lower else ""
     normalized_prefix = model_prefix.replace("-", "_")
-    std_specs = [s for s in PROVIDERS if not s.is_gateway and not s.is_local]
 
     # Prefer explicit provider prefix — prevents `github-copilot/...codex` matching openai_codex.
-    for spec in std_specs:
-        if model_prefix and normalized_prefix == spec.name:
-            return spec
+    if normalized_prefix in _STD_NAMES:
+        return _BY_NAME[normalized_prefix]
 
-    for spec in std_specs:
+    for spec in _STD_SPECS:
         if any(kw in model_lower or kw.replace("-", "_") in model_normalized for kw in spec.keywords):
             return spec
     return None
@@ -456,7 +462,4 @@ def find_gateway(
 
 def find_by_name(name: str) -> ProviderSpec | None:
     """Find a provider spec by config field name, e.g. "dashscope"."""
-    for spec in PROVIDERS:
-        if spec.name == name:
-            return spec
-    return None
+    return _BY_NAME.get(name)
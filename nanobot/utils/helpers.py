@@ -1,6 +1,9 @@
 """Utility functions for nanobot."""
 
+import os
 import re
+import secrets
+import shutil
 from datetime import datetime
 from pathlib import Path
 
@@ -22,6 +25,74 @@ def get_workspace_path(workspace: str | None = None) -> Path:
     return ensure_dir(path)
 
 
+def read_text_cached(path: Path, cache: dict[Path, tuple[tuple[int, int], str]]) -> str | None:
+    """Read a UTF-8 file, reusing the cached text while its mtime/size are unchanged.
+
+    Returns None if the file does not exist.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        cache.pop(path, None)
+        return None
+    key = (st.st_mtime_ns, st.st_size)
+    cached = cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+    content = path.read_text(encoding="utf-8")
+    cache[path] = (key, content)
+    return content
+
+
+def atomic_write_text(path: Path, content: str, *, durable: bool = False) -> None:
+    """Atomically replace a UTF-8 file.
+
+    Writes to a uniquely named sibling temp file and renames it over the target, so
+    readers never see a partial write and concurrent writers don't clash. Symlinks are
+    written through, and an existing file keeps its permission bits.
+
+    With durable=True the data and the rename are also fsynced. That blocks on the disk,
+    so leave it off for writes made from the event loop.
+    """
+    path = path.resolve()
+    tmp = path.with_name(f".{path.name}.{secrets.token_hex(6)}.tmp")
+    # O_EXCL + 0o666 behaves like open(path, "w") for new files: the umask applies.
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            shutil.copymode(path, tmp)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    if durable:
+        _fsync_dir(path.parent)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename in directory; best effort (not supported on Windows)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def timestamp() -> str:
     """Current ISO timestamp."""
     return datetime.now().isoformat()
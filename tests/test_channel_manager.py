@@ -0,0 +1,69 @@
+"""Tests for ChannelManager lifecycle."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from nanobot.bus.queue import MessageBus
+from nanobot.channels.base import BaseChannel
+from nanobot.channels.manager import ChannelManager
+from nanobot.config.schema import Config
+
+
+class _SlowChannel(BaseChannel):
+    name = "slow"
+
+    def __init__(self, bus: MessageBus, delay: float, fail: bool = False, events: list | None = None):
+        super().__init__(None, bus)
+        self.delay = delay
+        self.fail = fail
+        self.stopped = False
+        self.events = events if events is not None else []
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        self.events.append(("start", id(self)))
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            self.events.append(("fail", id(self)))
+            raise RuntimeError("boom")
+        self.stopped = True
+        self.events.append(("stop", id(self)))
+
+    async def send(self, msg) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_stop_all_stops_channels_concurrently() -> None:
+    bus = MessageBus()
+    manager = ChannelManager(Config(), bus)
+    manager.channels = {f"c{i}": _SlowChannel(bus, delay=0.2) for i in range(5)}
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await manager.stop_all()
+
+    assert loop.time() - started < 0.6
+    assert all(ch.stopped for ch in manager.channels.values())
+
+
+@pytest.mark.asyncio
+async def test_stop_all_isolates_channel_errors() -> None:
+    bus = MessageBus()
+    manager = ChannelManager(Config(), bus)
+    events: list = []
+    # bad raises while good's stop is still in flight
+    bad = _SlowChannel(bus, delay=0.05, fail=True, events=events)
+    good = _SlowChannel(bus, delay=0.1, events=events)
+    manager.channels = {"bad": bad, "good": good}
+
+    await manager.stop_all()
+
+    assert good.stopped
+    assert [kind for kind, _ in events] == ["start", "start", "fail", "stop"]
+    assert events[2] == ("fail", id(bad))
@@ -1,11 +1,14 @@
+import asyncio
 import shutil
+import sys
+import types
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from typer.testing import CliRunner
 
-from nanobot.cli.commands import app
+from nanobot.cli.commands import _run_event_loop, app
 from nanobot.config.schema import Config
 from nanobot.providers.litellm_provider import LiteLLMProvider
 from nanobot.providers.openai_codex_provider import _strip_model_prefix
@@ -128,3 +131,68 @@ def test_litellm_provider_canonicalizes_github_copilot_hyphen_prefix():
 def test_openai_codex_strip_prefix_supports_hyphen_and_underscore():
     assert _strip_model_prefix("openai-codex/gpt-5.1-codex") == "gpt-5.1-codex"
     assert _strip_model_prefix("openai_codex/gpt-5.1-codex") == "gpt-5.1-codex"
+
+
+def test_find_by_model_caches_repeated_lookups():
+    find_by_model.cache_clear()
+
+    assert find_by_model("deepseek-chat").name == "deepseek"
+    assert find_by_model("deepseek-chat").name == "deepseek"
+    assert find_by_model("no-such-model-family") is None
+    assert find_by_model("no-such-model-family") is None
+
+    info = find_by_model.cache_info()
+    assert (info.hits, info.misses) == (2, 2)
+
+
+def _fake_uvloop(created: list):
+    module = types.ModuleType("uvloop")
+
+    def new_event_loop():
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    module.new_event_loop = new_event_loop
+    return module
+
+
+def test_run_event_loop_uses_uvloop_when_installed(monkeypatch):
+    created = []
+    monkeypatch.setitem(sys.modules, "uvloop", _fake_uvloop(created))
+    monkeypatch.setattr(sys, "platform", "linux")
+
+    ran = []
+
+    async def main():
+        ran.append(asyncio.get_running_loop())
+
+    _run_event_loop(main())
+
+    assert len(created) == 1
+    assert ran == created
+
+
+def test_run_event_loop_falls_back_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)  # makes `import uvloop` raise ImportError
+    ran = []
+
+    async def main():
+        ran.append(asyncio.get_running_loop())
+
+    _run_event_loop(main())
+
+    assert len(ran) == 1
+
+
+def test_run_event_loop_skips_uvloop_on_windows(monkeypatch):
+    created = []
+    monkeypatch.setitem(sys.modules, "uvloop", _fake_uvloop(created))
+    monkeypatch.setattr(sys, "platform", "win32")
+
+    async def main():
+        pass
+
+    _run_event_loop(main())
+
+    assert created == []
@@ -0,0 +1,80 @@
+"""Tests for atomic config/state file writes."""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nanobot.config.loader import save_config
+from nanobot.config.schema import Config
+from nanobot.utils.helpers import atomic_write_text
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+def test_save_config_preserves_file_mode(tmp_path) -> None:
+    path = tmp_path / "config.json"
+    path.write_text("{}", encoding="utf-8")
+    path.chmod(0o600)
+
+    save_config(Config(), path)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert "agents" in json.loads(path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+def test_save_config_writes_through_symlink(tmp_path) -> None:
+    target = tmp_path / "real" / "config.json"
+    target.parent.mkdir()
+    target.write_text("{}", encoding="utf-8")
+    link = tmp_path / "config.json"
+    link.symlink_to(target)
+
+    save_config(Config(), link)
+
+    assert link.is_symlink()
+    assert "agents" in json.loads(target.read_text(encoding="utf-8"))
+
+
+def test_atomic_write_concurrent_writers(tmp_path) -> None:
+    path = tmp_path / "MEMORY.md"
+    payloads = [f"version {i}\n" * 200 for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(5):
+            list(pool.map(lambda text: atomic_write_text(path, text), payloads))
+
+    assert path.read_text(encoding="utf-8") in payloads
+    assert os.listdir(tmp_path) == ["MEMORY.md"]
+
+
+def test_atomic_write_cleans_up_temp_file_on_failure(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "jobs.json"
+    path.write_text("old", encoding="utf-8")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        atomic_write_text(path, "new")
+
+    assert path.read_text(encoding="utf-8") == "old"
+    assert os.listdir(tmp_path) == ["jobs.json"]
+
+
+def test_only_durable_writes_fsync(tmp_path, monkeypatch) -> None:
+    synced = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: (synced.append(fd), real_fsync(fd)))
+
+    atomic_write_text(tmp_path / "session.jsonl", "{}\n")
+    assert synced == []
+
+    save_config(Config(), tmp_path / "config.json")
+    assert synced
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime as real_datetime
 from pathlib import Path
 import datetime as datetime_module
@@ -64,3 +65,23 @@ def test_runtime_context_is_separate_untrusted_user_message(tmp_path) -> None:
 
     assert messages[-1]["role"] == "user"
     assert messages[-1]["content"] == "Return exactly: OK"
+
+
+def test_bootstrap_files_reloaded_only_when_changed(tmp_path) -> None:
+    """Bootstrap files are cached, but edits on disk are picked up."""
+    workspace = _make_workspace(tmp_path)
+    agents = workspace / "AGENTS.md"
+    agents.write_text("agents-v1", encoding="utf-8")
+    builder = ContextBuilder(workspace)
+
+    assert "agents-v1" in builder.build_system_prompt()
+
+    agents.write_text("agents-v2!", encoding="utf-8")
+    st = agents.stat()
+    os.utime(agents, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    prompt = builder.build_system_prompt()
+    assert "agents-v2!" in prompt
+    assert "agents-v1" not in prompt
+
+    agents.unlink()
+    assert "## AGENTS.md" not in builder.build_system_prompt()
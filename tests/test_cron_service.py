@@ -1,3 +1,6 @@
+import os
+import threading
+
 import pytest
 
 from nanobot.cron.service import CronService
@@ -28,3 +31,56 @@ def test_add_job_accepts_valid_timezone(tmp_path) -> None:
 
     assert job.schedule.tz == "America/Vancouver"
     assert job.state.next_run_at_ms is not None
+
+
+@pytest.mark.asyncio
+async def test_start_loads_existing_store(tmp_path) -> None:
+    store_path = tmp_path / "cron" / "jobs.json"
+    CronService(store_path).add_job(
+        name="every minute",
+        schedule=CronSchedule(kind="every", every_ms=60_000),
+        message="hello",
+    )
+
+    service = CronService(store_path)
+    io_threads = {}
+    for name in ("_load_store", "_save_store"):
+        def record(_name=name, _real=getattr(service, name)):
+            io_threads[_name] = threading.get_ident()
+            return _real()
+        setattr(service, name, record)
+
+    await service.start()
+    try:
+        # jobs.json I/O during start() runs in a worker thread, not on the event loop
+        assert set(io_threads) == {"_load_store", "_save_store"}
+        assert threading.get_ident() not in io_threads.values()
+        assert service.status()["jobs"] == 1
+        assert service.status()["next_wake_at_ms"] is not None
+    finally:
+        service.stop()
+
+
+def test_failed_save_keeps_previous_store(tmp_path, monkeypatch) -> None:
+    store_path = tmp_path / "cron" / "jobs.json"
+    service = CronService(store_path)
+    service.add_job(
+        name="every minute",
+        schedule=CronSchedule(kind="every", every_ms=60_000),
+        message="hello",
+    )
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError, match="disk full"):
+        service.add_job(
+            name="second",
+            schedule=CronSchedule(kind="every", every_ms=60_000),
+            message="hello again",
+        )
+    monkeypatch.undo()
+
+    assert [p.name for p in store_path.parent.iterdir()] == ["jobs.json"]
+    assert [job.name for job in CronService(store_path).list_jobs()] == ["every minute"]
@@ -5,6 +5,7 @@ When memory consolidation receives dict values instead of strings from the LLM
 tool call response, it should serialize them to JSON instead of raising TypeError.
 """
 
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -145,3 +146,45 @@ class TestMemoryConsolidationTypeHandling:
 
         assert result is True
         provider.chat.assert_not_called()
+
+
+class TestLongTermMemoryReads:
+    """MEMORY.md reads are cached but stay consistent with writes."""
+
+    def test_write_then_read_round_trips(self, tmp_path: Path) -> None:
+        store = MemoryStore(tmp_path)
+        assert store.read_long_term() == ""
+
+        store.write_long_term("fact one")
+        assert store.read_long_term() == "fact one"
+
+        store.write_long_term("fact two")
+        assert store.read_long_term() == "fact two"
+        assert [p.name for p in store.memory_dir.iterdir()] == ["MEMORY.md"]
+
+
+class TestConcurrentConsolidation:
+    """Consolidations of different sessions share one MEMORY.md/HISTORY.md."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_sessions_all_succeed(self, tmp_path: Path) -> None:
+        store = MemoryStore(tmp_path)
+        sessions = [_make_session(message_count=60) for _ in range(16)]
+        updates = ["# Memory\n" + f"Fact {i}.\n" * 20_000 for i in range(len(sessions))]
+        provider = AsyncMock()
+        provider.chat = AsyncMock(side_effect=[
+            _make_tool_response(f"[2026-01-01] Session {i} entry.", updates[i])
+            for i in range(len(sessions))
+        ])
+
+        results = await asyncio.gather(*(
+            store.consolidate(s, provider, "test-model", memory_window=50) for s in sessions
+        ))
+
+        assert results == [True] * len(sessions)
+        assert all(s.last_consolidated == 35 for s in sessions)
+        history = store.history_file.read_text()
+        for i in range(len(sessions)):
+            assert history.count(f"Session {i} entry.") == 1
+        assert store.read_long_term() in updates
+        assert sorted(p.name for p in store.memory_dir.iterdir()) == ["HISTORY.md", "MEMORY.md"]
@@ -0,0 +1,71 @@
+"""Tests for SkillsLoader discovery and caching."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from nanobot.agent.skills import SkillsLoader
+
+
+def _write_skill(root: Path, name: str, body: str) -> Path:
+    skill_file = root / name / "SKILL.md"
+    skill_file.parent.mkdir(parents=True, exist_ok=True)
+    skill_file.write_text(body, encoding="utf-8")
+    return skill_file
+
+
+def test_load_skill_picks_up_edits(tmp_path) -> None:
+    workspace = tmp_path / "workspace"
+    loader = SkillsLoader(workspace, builtin_skills_dir=tmp_path / "builtin")
+    skill_file = _write_skill(workspace / "skills", "demo", "---\ndescription: v1\n---\nbody")
+
+    assert loader.get_skill_metadata("demo") == {"description": "v1"}
+
+    skill_file.write_text("---\ndescription: v2!\n---\nbody", encoding="utf-8")
+    st = skill_file.stat()
+    os.utime(skill_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert loader.get_skill_metadata("demo") == {"description": "v2!"}
+
+    skill_file.unlink()
+    assert loader.load_skill("demo") is None
+
+
+def test_workspace_skill_overrides_builtin(tmp_path) -> None:
+    workspace = tmp_path / "workspace"
+    builtin = tmp_path / "builtin"
+    _write_skill(builtin, "demo", "builtin")
+    _write_skill(builtin, "other", "other")
+    _write_skill(workspace / "skills", "demo", "workspace")
+    loader = SkillsLoader(workspace, builtin_skills_dir=builtin)
+
+    skills = {s["name"]: s["source"] for s in loader.list_skills(filter_unavailable=False)}
+
+    assert skills == {"demo": "workspace", "other": "builtin"}
+    assert loader.load_skill("demo") == "workspace"
+    assert loader.load_skill("other") == "other"
+
+
+def test_missing_binary_lookup_is_cached_briefly(tmp_path, monkeypatch) -> None:
+    from nanobot.agent import skills as skills_module
+
+    calls: list[str] = []
+
+    def fake_which(name: str) -> str | None:
+        calls.append(name)
+        return None
+
+    monkeypatch.setattr(skills_module.shutil, "which", fake_which)
+    monkeypatch.setattr(skills_module, "_which_cache", {})
+    workspace = tmp_path / "workspace"
+    _write_skill(
+        workspace / "skills", "needs-bin",
+        '---\nmetadata: {"nanobot": {"requires": {"bins": ["nanobot-test-bin"]}}}\n---\nbody',
+    )
+    loader = SkillsLoader(workspace, builtin_skills_dir=tmp_path / "builtin")
+
+    summary = loader.build_skills_summary()
+
+    assert 'available="false"' in summary
+    assert "CLI: nanobot-test-bin" in summary
+    assert calls == ["nanobot-test-bin"]
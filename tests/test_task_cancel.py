@@ -165,3 +165,59 @@ class TestSubagentCancellation:
         provider.get_default_model.return_value = "test-model"
         mgr = SubagentManager(provider=provider, workspace=MagicMock(), bus=bus)
         assert await mgr.cancel_by_session("nonexistent") == 0
+
+
+class TestActiveTaskTracking:
+    @pytest.mark.asyncio
+    async def test_finished_tasks_release_session_entry(self):
+        from nanobot.bus.events import InboundMessage, OutboundMessage
+
+        loop, bus = _make_loop()
+        loop._process_message = AsyncMock(
+            return_value=OutboundMessage(channel="test", chat_id="c1", content="hi")
+        )
+        runner = asyncio.create_task(loop.run())
+        try:
+            await bus.publish_inbound(
+                InboundMessage(channel="test", sender_id="u1", chat_id="c1", content="hello")
+            )
+            out = await asyncio.wait_for(bus.consume_outbound(), timeout=1.0)
+            assert out.content == "hi"
+            for _ in range(10):
+                if not loop._active_tasks:
+                    break
+                await asyncio.sleep(0)
+
+            assert "test:c1" not in loop._active_tasks
+        finally:
+            loop.stop()
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+
+
+class TestMcpConnect:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_wait_for_single_connect(self):
+        loop, _bus = _make_loop()
+        loop._mcp_servers = {"srv": object()}
+        calls = 0
+        release = asyncio.Event()
+
+        async def fake_connect(servers, registry, stack):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+
+        with patch("nanobot.agent.tools.mcp.connect_mcp_servers", fake_connect):
+            first = asyncio.create_task(loop._connect_mcp())
+            await asyncio.sleep(0)
+            second = asyncio.create_task(loop._connect_mcp())
+            await asyncio.sleep(0)
+            assert not second.done()
+
+            release.set()
+            await asyncio.gather(first, second)
+
+        assert calls == 1
+        assert loop._mcp_connected
+        await loop.close_mcp()
@@ -106,3 +106,15 @@ def test_exec_extract_absolute_paths_captures_posix_absolute_paths() -> None:
     paths = ExecTool._extract_absolute_paths(cmd)
     assert "/tmp/data.txt" in paths
     assert "/tmp/out.txt" in paths
+
+
+def test_registry_definitions_track_registration_changes() -> None:
+    reg = ToolRegistry()
+    reg.register(SampleTool())
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["sample"]
+
+    reg.register(ExecTool())
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["sample", "exec"]
+
+    reg.unregister("sample")
+    assert [d["function"]["name"] for d in reg.get_definitions()] == ["exec"]